@@ -26,11 +26,11 @@ Attributes:
 from __future__ import annotations
 
 import hashlib
-from typing import Any, cast
+from typing import Any, Tuple, cast
 
 from .utils import as_array, ByteLike
 from .sc25519 import ScalarLike, Scalar
-from ._sodium import lib
+from ._sodium import ffi, lib
 
 # Calculate the base point (generator) so that it can be used in additions/subtractions
 # We need to find 4 / 5 on the prime field defined by prime q = 2^255 - 19
@@ -40,6 +40,8 @@ _GENERATOR_DATA = (4 * pow(5, Q - 2, Q)).to_bytes(
     lib.crypto_core_ed25519_BYTES, "little"
 )
 _IDENTITY_DATA = (1).to_bytes(lib.crypto_core_ed25519_BYTES, "little")
+# Hash used to derive the challenges of ring signatures
+_SCALAR_HASH_NAME = "sha3_512"
 
 
 class Point:
@@ -67,9 +69,21 @@ class Point:
     def __hash__(self) -> int:
         return hash(repr(self))
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (Point, (self.as_bytes(),))
+
     def as_bytes(self) -> bytes:
         return bytes(self.data)
 
+    def as_buffer(self) -> ffi.buffer:
+        """Return a view of the point's encoding without copying it.
+
+        The view can be passed anywhere a bytes-like object is accepted (e.g. to a
+        hash object's `update` method), but shares memory with the point, so it
+        must not be written to.
+        """
+        return ffi.buffer(self.data)
+
     @classmethod
     def from_uniform(cls, n: ByteLike) -> Point:
         """Map a set of 32-bytes to a point on the curve."""
@@ -118,6 +132,50 @@ class Point:
         lib.crypto_scalarmult_ed25519_noclamp(out.data, other.data, self.data)
         return out
 
+    @staticmethod
+    def mul_base(scalar: ScalarLike) -> Point:
+        """Multiply the base point by a scalar.
+
+        Sodium performs fixed-base multiplication using a precomputed table of
+        multiples of the base point, which is several times faster than a generic
+        scalar multiplication.
+        """
+        if isinstance(scalar, int):
+            scalar = Scalar(scalar)
+        elif not isinstance(scalar, Scalar):
+            raise TypeError("scalar must be an integer or a Scalar")
+        out = Point()
+        lib.crypto_scalarmult_ed25519_base_noclamp(out.data, scalar.data)
+        return out
+
+    @staticmethod
+    def double_scalar_mul(a: ScalarLike, p: Point, b: ScalarLike, q: Point) -> Point:
+        """Compute a * p + b * q.
+
+        Sodium does not expose its interleaved double scalar multiplication, so this
+        performs two scalar multiplications followed by a single addition. Passing the
+        generator as either point will use Sodium's precomputed base point table.
+
+        The products are written into scratch buffers instead of intermediate points,
+        since this is called twice per ring member when signing and verifying.
+        """
+        if isinstance(a, int):
+            a = Scalar(a)
+        if isinstance(b, int):
+            b = Scalar(b)
+        if not isinstance(a, Scalar) or not isinstance(b, Scalar):
+            raise TypeError("scalars must be integers or Scalars")
+        out = Point()
+        # Sodium leaves the output untouched for points of small order
+        tmp = as_array(_IDENTITY_DATA)
+        for buf, scalar, point in ((out.data, a, p), (tmp, b, q)):
+            if isinstance(point, Generator):
+                lib.crypto_scalarmult_ed25519_base_noclamp(buf, scalar.data)
+            else:
+                lib.crypto_scalarmult_ed25519_noclamp(buf, scalar.data, point.data)
+        lib.crypto_core_ed25519_add(out.data, out.data, tmp)
+        return out
+
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, Point):
             return bytes(self.data) == bytes(other.data)
@@ -143,30 +201,55 @@ class Generator(Point):
     def __init__(self) -> None:
         super().__init__(_GENERATOR_DATA)
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (Generator, ())
+
     def __rmul__(self, other: ScalarLike) -> Point:
-        if isinstance(other, int):
-            other = Scalar(other)
-        elif not isinstance(other, Scalar):
+        if not isinstance(other, (int, Scalar)):
             return NotImplemented
-        out = Point()
-        lib.crypto_scalarmult_ed25519_base_noclamp(out.data, other.data)
-        return out
+        return Point.mul_base(other)
 
 
 O = Point()  # noqa: 741
 G = Generator()
 
 
-def hash_to_scalar(data: ByteLike, hash_name: str = "sha3_512") -> int:
+def new_scalar_hasher(
+    data: ByteLike = b"", hash_name: str = _SCALAR_HASH_NAME
+) -> hashlib._Hash:
+    """Create a hash object to incrementally hash data to an integer mod Q.
+
+    Args:
+        data: An object convertible to bytes to initialize the hash with.
+        hash_name: The hashing algorithm to use.
+
+    Returns:
+        A hash object which can be updated with further data and then be passed to
+        `hasher_to_scalar`.
+
+    """
+    return hashlib.new(hash_name, bytes(data))
+
+
+def hasher_to_scalar(hasher: hashlib._Hash) -> int:
+    """Map the digest of a hash object to an integer mod Q.
+
+    Returns:
+        An integer in the range [0, ..., Q - 1] where Q = 2^255 - 19.
+
+    """
+    return int.from_bytes(hasher.digest(), "little") % Q
+
+
+def hash_to_scalar(data: ByteLike, hash_name: str = _SCALAR_HASH_NAME) -> int:
     """Hash data to an integer mod Q.
 
     Args:
         data: An object convertible to bytes that will be hashed.
-        hash: The hashing algorithm to use.
+        hash_name: The hashing algorithm to use.
 
     Returns:
         An integer in the range [0, ..., Q - 1] where Q = 2^255 - 19.
 
     """
-    digest = hashlib.new(hash_name, bytes(data)).digest()
-    return int.from_bytes(digest, "little") % Q
+    return hasher_to_scalar(new_scalar_hasher(data, hash_name))
@@ -14,20 +14,41 @@
 
 from __future__ import annotations
 
+import concurrent.futures
 import dataclasses
 import functools
-import operator
-from typing import ByteString, List
+import itertools
+from typing import ByteString, List, Optional, Sequence, Tuple
 
-from .ge import Point, G, hash_to_scalar
+from .ge import Point, G, hasher_to_scalar, new_scalar_hasher
 from .sc25519 import Scalar
 
 
+# Number of ring members or signatures sent to an executor's worker at a time
+_CHUNK_SIZE = 16
+
+
+@functools.lru_cache(maxsize=4096)
+def _hash_to_point_cached(data: bytes) -> Point:
+    return Point(data).hash_to_point()
+
+
+def _hash_to_point(point: Point) -> Point:
+    """Hash a point to a point.
+
+    Results are cached by the point's encoding, so that rings which are reused
+    across signatures only pay for hashing each public key once.
+    """
+    return _hash_to_point_cached(point.as_bytes())
+
+
 class PrivateKey:
-    __slots__ = ["scalar"]
+    __slots__ = ["scalar", "_public_key", "_image"]
 
     def __init__(self, scalar: Scalar) -> None:
         self.scalar = scalar
+        self._public_key: Optional[PublicKey] = None
+        self._image: Optional[Point] = None
 
     @classmethod
     def generate(cls) -> PrivateKey:
@@ -45,10 +66,14 @@ class PrivateKey:
         # https://github.com/openssl/openssl/blob/36e619d70f86f9dd52c57b6ac8a3bfea3c0a2745/crypto/ec/curve25519.c#L5544)
         # but this destroys the associativity and distributivity
         # properties needed for the ring construction
-        return PublicKey(self.scalar * G)
+        if self._public_key is None:
+            self._public_key = PublicKey(Point.mul_base(self.scalar))
+        return self._public_key
 
     def key_image(self) -> Point:
-        return self.scalar * self.public_key().point.hash_to_point()
+        if self._image is None:
+            self._image = self.scalar * _hash_to_point(self.public_key().point)
+        return self._image
 
 
 class PublicKey:
@@ -101,7 +126,9 @@ def sign(
         private_key: The secret key of the signer.
         key_index: The index to the corresponding public key. Note that they key
             index should be unpredictable; shuffle the public keys before generating
-            the ring signature if this is not the case.
+            the ring signature if this is not the case. The key image is computed
+            from `public_keys[key_index]`, which is trusted to equal
+            `private_key * G`; if it doesn't, the signature will not verify.
 
     Returns:
         A ring signature.
@@ -109,30 +136,51 @@ def sign(
     # We follow the notation from the CryptoNote white paper, section 4.4
     x = private_key
     s = key_index
-    I = PrivateKey(private_key).key_image()  # noqa: E741
-    H_s = hash_to_scalar
-
-    def H_p(point: Point) -> Point:
-        return point.hash_to_point()
-
-    buffer_ = bytearray(message)
-
-    c = []
-    r = []
-    for i, P_i in enumerate(public_keys):
-        if i == key_index:
-            q_s = Scalar.random()
-            buffer_ += (q_s * G).as_bytes()
-            buffer_ += (q_s * H_p(P_i)).as_bytes()
-        else:
-            q_i = Scalar.random()
-            w_i = Scalar.random()
-            c.append(w_i)
-            r.append(q_i)
-            buffer_ += (q_i * G + w_i * P_i).as_bytes()
-            buffer_ += (q_i * H_p(P_i) + w_i * I).as_bytes()
-    c.insert(s, H_s(buffer_) - functools.reduce(operator.add, c))
-    r.insert(s, q_s - c[s] * x)
+    H_s = hasher_to_scalar
+    H_p = _hash_to_point
+
+    n = len(public_keys)
+    if not 0 <= s < n:
+        raise ValueError("key index out of range")
+    # The signer's public key is in the ring, so it doesn't need to be derived from
+    # the private key to calculate the key image
+    I = x * H_p(public_keys[s])  # noqa: E741
+
+    hasher = new_scalar_hasher(message)
+    # Bind the functions called per ring member to locals; the as_buffer() method
+    # is still looked up on each new point
+    update = hasher.update
+    random_scalar = Scalar.random
+    mul2 = Point.double_scalar_mul
+
+    # Placeholders, every entry is assigned below
+    c = [Scalar()] * n
+    r = [Scalar()] * n
+    sum_c = Scalar()
+
+    # The signer's commitment is made between two loops so that they don't branch
+    for i, P_i in enumerate(public_keys[:s]):
+        q_i = random_scalar()
+        w_i = random_scalar()
+        c[i] = w_i
+        r[i] = q_i
+        sum_c += w_i
+        update(mul2(q_i, G, w_i, P_i).as_buffer())
+        update(mul2(q_i, H_p(P_i), w_i, I).as_buffer())
+    q_s = random_scalar()
+    update(Point.mul_base(q_s).as_buffer())
+    update((q_s * H_p(public_keys[s])).as_buffer())
+    for i in range(s + 1, n):
+        P_i = public_keys[i]
+        q_i = random_scalar()
+        w_i = random_scalar()
+        c[i] = w_i
+        r[i] = q_i
+        sum_c += w_i
+        update(mul2(q_i, G, w_i, P_i).as_buffer())
+        update(mul2(q_i, H_p(P_i), w_i, I).as_buffer())
+    c[s] = H_s(hasher) - sum_c
+    r[s] = q_s - c[s] * x
 
     return (public_keys, I, c, r)
 
@@ -142,19 +190,48 @@ def ring_sign(
     public_keys, I, c, r = sign(message, public_keys, private_key, key_index)
     return RingSignature(public_keys, I, c, r)
 
+
+def _encrypt_key_image(public_key: Point, key_image: Point) -> Tuple[Point, Point]:
+    r_i = Scalar.random()
+    shared_secret = r_i * public_key
+    public = Point.mul_base(r_i)
+    return public, shared_secret + key_image
+
+
 def within_ring_sign(
-    message: ByteString, public_keys: List[Point], private_key: Scalar, key_index: int
-) -> RingSignature:
+    message: ByteString,
+    public_keys: List[Point],
+    private_key: Scalar,
+    key_index: int,
+    executor: Optional[concurrent.futures.Executor] = None,
+) -> WithinRingSignature:
+    """Sign the given message, encrypting the key image for each ring member.
+
+    Args:
+        message: The message to sign.
+        public_keys: The public keys of the group to generate a ring signature of.
+        private_key: The secret key of the signer.
+        key_index: The index to the corresponding public key.
+        executor: If given, the key image is encrypted for the ring members in
+            parallel using this executor.
+
+    Returns:
+        A within ring signature.
+    """
     public_keys, I, c, r = sign(message, public_keys, private_key, key_index)
 
+    images = itertools.repeat(I, len(public_keys))
+    if executor is None:
+        encrypted = map(_encrypt_key_image, public_keys, images)
+    else:
+        encrypted = executor.map(
+            _encrypt_key_image, public_keys, images, chunksize=_CHUNK_SIZE
+        )
     public_points = []
     enc_points = []
-    for public_key in public_keys:
-        r_i = Scalar.random()
-        shared_secret = r_i * public_key
-        public = r_i * G
+    for public, enc_point in encrypted:
         public_points.append(public)
-        enc_points.append(shared_secret + I)
+        enc_points.append(enc_point)
     return WithinRingSignature(public_keys, public_points, enc_points, c, r)
 
 def ring_verify(message: ByteString, signature: RingSignature) -> bool:
@@ -166,20 +243,83 @@ def ring_verify(message: ByteString, signature: RingSignature) -> bool:
     """
     public_keys = signature.public_keys
     I, c, r = signature.key_image, signature.c, signature.r
-    H_s = hash_to_scalar
+    H_s = hasher_to_scalar
+    H_p = _hash_to_point
+
+    if not len(public_keys) == len(c) == len(r):
+        return False
+
+    hasher = new_scalar_hasher(message)
+    update = hasher.update
+    mul2 = Point.double_scalar_mul
+    sum_c = Scalar()
+    for P_i, r_i, c_i in zip(public_keys, r, c):
+        update(mul2(r_i, G, c_i, P_i).as_buffer())
+        update(mul2(r_i, H_p(P_i), c_i, I).as_buffer())
+        sum_c += c_i
+
+    return H_s(hasher) - sum_c == 0
 
-    def H_p(point: Point) -> Point:
-        return point.hash_to_point()
 
-    buffer_ = bytearray(message)
-    for i, (P_i, r_i, c_i) in enumerate(zip(public_keys, r, c)):
-        buffer_ += (r_i * G + c_i * P_i).as_bytes()
-        buffer_ += (r_i * H_p(P_i) + c_i * I).as_bytes()
+def ring_verify_batch(
+    messages: Sequence[ByteString],
+    signatures: Sequence[RingSignature],
+    executor: Optional[concurrent.futures.Executor] = None,
+) -> bool:
+    """Verify that a batch of signatures is valid for the given messages.
 
-    return H_s(buffer_) - functools.reduce(operator.add, c) == 0
+    The challenges of a ring signature are derived by hashing each individual
+    commitment, so unlike Ed25519 signatures the verification equations cannot be
+    folded into a single random linear combination. The signatures are verified in
+    turn instead, sharing the hash-to-point cache between signatures over the same
+    ring and stopping at the first invalid signature.
 
-def within_ring_verify(message: ByteString, signature: WithinRingSignature, private_key: Scalar) -> bool:
-    index = signature.public_keys.index(PrivateKey(private_key).public_key().point)
+    Args:
+        messages: The messages to verify the signatures for.
+        signatures: The ring signatures to verify, one for each message.
+        executor: If given, the signatures are verified in parallel using this
+            executor. Calls into Sodium release the GIL, so both thread and
+            process pools can be used.
+
+    Returns:
+        Whether all signatures are valid.
+    """
+    if len(messages) != len(signatures):
+        raise ValueError("number of messages and signatures must match")
+    if executor is not None:
+        return all(
+            executor.map(ring_verify, messages, signatures, chunksize=_CHUNK_SIZE)
+        )
+    return all(
+        ring_verify(message, signature)
+        for message, signature in zip(messages, signatures)
+    )
+
+
+def within_ring_verify(
+    message: ByteString,
+    signature: WithinRingSignature,
+    private_key: Scalar,
+    public_key: Optional[Point] = None,
+) -> bool:
+    """Verify that a within ring signature is valid for the given message.
+
+    Args:
+        message: The message to verify the signature for.
+        signature: The within ring signature to verify.
+        private_key: The secret key of a member of the ring.
+        public_key: The public key corresponding to the secret key. If not given, it
+            is derived from the secret key.
+    """
+    if public_key is None:
+        public_key = PrivateKey(private_key).public_key().point
+    # Compare encodings directly rather than calling Point.__eq__ for each key
+    data = public_key.as_bytes()
+    for index, member in enumerate(signature.public_keys):
+        if member.as_bytes() == data:
+            break
+    else:
+        raise ValueError("public key of the private key is not in the ring")
     public_point = signature.public_points[index]
     enc_point = signature.enc_points[index]
     shared_secret = private_key * public_point
@@ -23,7 +23,7 @@ Attributes:
 """
 from __future__ import annotations
 
-from typing import Any, Union
+from typing import Any, Tuple, Union
 
 from .utils import as_array, ByteLike
 from ._sodium import lib
@@ -68,6 +68,9 @@ class Scalar:
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({int(self)})"
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (Scalar, (bytes(self.data),))
+
     @classmethod
     def from_unreduced(cls, n: ByteLike) -> Scalar:
         """Reduces a 64-byte scalar to a 32-byte scalar by applying mod L.
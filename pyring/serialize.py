@@ -13,15 +13,10 @@
 # limitations under the License.
 
 import base64
+import functools
 import string
-import textwrap
 import uuid
-
-import pyasn1.codec.der.encoder
-import pyasn1.codec.der.decoder
-import pyasn1.codec.native.decoder
-from pyasn1.type.namedtype import NamedType, NamedTypes
-from pyasn1.type.univ import Sequence, SequenceOf, OctetString, ObjectIdentifier
+from typing import Callable, Iterable, List, Tuple, TypeVar, Union
 
 from .ge import Point
 from .sc25519 import Scalar
@@ -32,129 +27,240 @@ _PEM_OPENING = "-----BEGIN RING SIGNATURE-----"
 _PEM_CLOSING = "-----END RING SIGNATURE-----"
 _UUID = uuid.UUID(hex="3b5e61af-c4ec-496e-95e9-4b64bccdc809")
 _OBJECT_ID = (2, 25) + tuple(_UUID.bytes)
+_WHITESPACE = {ord(c): None for c in string.whitespace}
+
+# Signatures are encoded using DER following the ASN.1 schemas
+#
+#   RingSignature ::= SEQUENCE {
+#       algorithm OBJECT IDENTIFIER,
+#       key_image OCTET STRING,
+#       public_keys SEQUENCE OF OCTET STRING,
+#       c SEQUENCE OF OCTET STRING,
+#       r SEQUENCE OF OCTET STRING
+#   }
+#
+#   WithinRingSignature ::= SEQUENCE {
+#       algorithm OBJECT IDENTIFIER,
+#       public_points SEQUENCE OF OCTET STRING,
+#       enc_points SEQUENCE OF OCTET STRING,
+#       public_keys SEQUENCE OF OCTET STRING,
+#       c SEQUENCE OF OCTET STRING,
+#       r SEQUENCE OF OCTET STRING
+#   }
+#
+# Both are identified with an object ID following Recommendation ITU-T X.667. The
+# UUID4 used is 3b5e61af-c4ec-496e-95e9-4b64bccdc809. The schema is small and fixed,
+# so the encoding is written and parsed by hand.
+_OBJECT_IDENTIFIER = 0x06
+_OCTET_STRING = 0x04
+_SEQUENCE = 0x30
 
+_T = TypeVar("_T")
 
-class RingSignatureSchema(Sequence):
-    """An ASN.1 schema for ring signatures.
 
-    Ring signatures are identified with an object ID following Recommendation
-    ITU-T X.667. The UUID4 used is 3b5e61af-c4ec-496e-95e9-4b64bccdc809.
-    """
+def _encode_length(length: int) -> bytes:
+    if length < 0x80:
+        return bytes([length])
+    data = length.to_bytes((length.bit_length() + 7) // 8, "big")
+    return bytes([0x80 | len(data)]) + data
+
+
+def _encode_tlv(tag: int, value: bytes) -> bytes:
+    return bytes([tag]) + _encode_length(len(value)) + value
+
+
+def _encode_object_id(arcs: Tuple[int, ...]) -> bytes:
+    value = bytearray()
+    for arc in (40 * arcs[0] + arcs[1],) + arcs[2:]:
+        # Arcs are written base 128, most significant group first
+        groups = [arc & 0x7F]
+        arc >>= 7
+        while arc:
+            groups.append(0x80 | (arc & 0x7F))
+            arc >>= 7
+        value += bytes(reversed(groups))
+    return _encode_tlv(_OBJECT_IDENTIFIER, bytes(value))
+
+
+_OBJECT_ID_DER = _encode_object_id(_OBJECT_ID)
 
-    componentType = NamedTypes(
-        NamedType("algorithm", ObjectIdentifier(value=_OBJECT_ID)),
-        NamedType("key_image", OctetString()),
-        NamedType("public_keys", SequenceOf(componentType=OctetString())),
-        NamedType("c", SequenceOf(componentType=OctetString())),
-        NamedType("r", SequenceOf(componentType=OctetString())),
+
+def _encode_sequence_of(values: Iterable[bytes]) -> bytes:
+    return _encode_tlv(
+        _SEQUENCE, b"".join(_encode_tlv(_OCTET_STRING, value) for value in values)
     )
 
-class WithinRingSignatureSchema(Sequence):
-    """An ASN.1 schema for within ring signatures.
 
-    Within ring signatures are identified with an object ID following
-    Recommendation ITU-T X.667. The UUID4 used is
-    3b5e61af-c4ec-496e-95e9-4b64bccdc809.
+def _decode_tlv(data: bytes, offset: int, tag: int) -> Tuple[bytes, int]:
+    """Read a single DER element.
+
+    Returns:
+        The value of the element starting at the given offset and the offset of the
+        element following it.
     """
+    if offset + 2 > len(data) or data[offset] != tag:
+        raise ValueError("unexpected ASN.1 element")
+    length = data[offset + 1]
+    offset += 2
+    if length & 0x80:
+        num_bytes = length & 0x7F
+        if not num_bytes or offset + num_bytes > len(data):
+            raise ValueError("invalid ASN.1 length")
+        length = int.from_bytes(data[offset : offset + num_bytes], "big")
+        offset += num_bytes
+    end = offset + length
+    if end > len(data):
+        raise ValueError("truncated ASN.1 element")
+    return data[offset:end], end
+
+
+def _decode_sequence_of(
+    data: bytes, offset: int, cls: Callable[[bytes], _T]
+) -> Tuple[List[_T], int]:
+    """Read a sequence of octet strings, constructing an object from each."""
+    sequence, offset = _decode_tlv(data, offset, _SEQUENCE)
+    values = []
+    position = 0
+    while position < len(sequence):
+        value, position = _decode_tlv(sequence, position, _OCTET_STRING)
+        values.append(cls(value))
+    return values, offset
+
+
+def _to_pem(der: bytes) -> str:
+    # Base64 contains no whitespace, so it can be split into lines of 64 directly
+    encoded = base64.b64encode(der).decode("ascii")
+    lines = [encoded[i : i + 64] for i in range(0, len(encoded), 64)]
+    der_base64 = "\n".join(lines)
+    return f"{_PEM_OPENING}\n{der_base64}\n{_PEM_CLOSING}"
+
+
+@functools.lru_cache(maxsize=1024)
+def _encode_ring_der(
+    key_image: bytes,
+    public_keys: Tuple[bytes, ...],
+    c: Tuple[bytes, ...],
+    r: Tuple[bytes, ...],
+) -> bytes:
+    return _encode_tlv(
+        _SEQUENCE,
+        _OBJECT_ID_DER
+        + _encode_tlv(_OCTET_STRING, key_image)
+        + _encode_sequence_of(public_keys)
+        + _encode_sequence_of(c)
+        + _encode_sequence_of(r),
+    )
+
 
-    componentType = NamedTypes(
-        NamedType("algorithm", ObjectIdentifier(value=_OBJECT_ID)),
-        NamedType("public_points", SequenceOf(componentType=OctetString())),
-        NamedType("enc_points", SequenceOf(componentType=OctetString())),
-        NamedType("public_keys", SequenceOf(componentType=OctetString())),
-        NamedType("c", SequenceOf(componentType=OctetString())),
-        NamedType("r", SequenceOf(componentType=OctetString())),
+@functools.lru_cache(maxsize=1024)
+def _encode_within_ring_der(
+    public_points: Tuple[bytes, ...],
+    enc_points: Tuple[bytes, ...],
+    public_keys: Tuple[bytes, ...],
+    c: Tuple[bytes, ...],
+    r: Tuple[bytes, ...],
+) -> bytes:
+    return _encode_tlv(
+        _SEQUENCE,
+        _OBJECT_ID_DER
+        + _encode_sequence_of(public_points)
+        + _encode_sequence_of(enc_points)
+        + _encode_sequence_of(public_keys)
+        + _encode_sequence_of(c)
+        + _encode_sequence_of(r),
     )
 
 
 def export_ring_pem(ring_signature: RingSignature) -> str:
-    """Export the ring signature to a PEM file."""
-    der = pyasn1.codec.der.encoder.encode(
-        pyasn1.codec.native.decoder.decode(
-            {
-                "key_image": bytes(ring_signature.key_image.data),
-                "public_keys": [
-                    bytes(public_key.data) for public_key in ring_signature.public_keys
-                ],
-                "r": [bytes(r.data) for r in ring_signature.r],
-                "c": [bytes(c.data) for c in ring_signature.c],
-            },
-            asn1Spec=RingSignatureSchema(),
-        )
+    """Export the ring signature to a PEM file.
+
+    The DER encoding is cached, so exporting the same signature again is cheap.
+    """
+    der = _encode_ring_der(
+        bytes(ring_signature.key_image.data),
+        tuple(bytes(public_key.data) for public_key in ring_signature.public_keys),
+        tuple(bytes(c.data) for c in ring_signature.c),
+        tuple(bytes(r.data) for r in ring_signature.r),
     )
-    der_base64 = "\n".join(textwrap.wrap(base64.b64encode(der).decode("ascii"), 64))
-    return f"{_PEM_OPENING}\n{der_base64}\n{_PEM_CLOSING}"
+    return _to_pem(der)
 
 
 def export_within_ring_pem(ring_signature: WithinRingSignature) -> str:
-    """Export the within ring signature to a PEM file."""
-    der = pyasn1.codec.der.encoder.encode(
-        pyasn1.codec.native.decoder.decode(
-            {
-                "public_points": [bytes(public_point.data) for public_point in ring_signature.public_points],
-                "enc_points": [bytes(enc_point.data) for enc_point in ring_signature.enc_points],
-                "public_keys": [
-                    bytes(public_key.data) for public_key in ring_signature.public_keys
-                ],
-                "r": [bytes(r.data) for r in ring_signature.r],
-                "c": [bytes(c.data) for c in ring_signature.c],
-            },
-            asn1Spec=WithinRingSignatureSchema(),
-        )
+    """Export the within ring signature to a PEM file.
+
+    The DER encoding is cached, so exporting the same signature again is cheap.
+    """
+    der = _encode_within_ring_der(
+        tuple(bytes(point.data) for point in ring_signature.public_points),
+        tuple(bytes(point.data) for point in ring_signature.enc_points),
+        tuple(bytes(public_key.data) for public_key in ring_signature.public_keys),
+        tuple(bytes(c.data) for c in ring_signature.c),
+        tuple(bytes(r.data) for r in ring_signature.r),
     )
-    der_base64 = "\n".join(textwrap.wrap(base64.b64encode(der).decode("ascii"), 64))
-    return f"{_PEM_OPENING}\n{der_base64}\n{_PEM_CLOSING}"
+    return _to_pem(der)
+
 
+def _decode_pem(signature: str) -> bytes:
+    """Decode a PEM encoded signature.
 
-def import_pem(signature: str) -> RingSignature:
+    Returns:
+        The contents of the DER encoded signature following its object ID.
+    """
     signature = signature.strip()
     if not signature.startswith(_PEM_OPENING) or not signature.endswith(_PEM_CLOSING):
         raise ValueError("invalid encapsulation")
     # Strip opening/closing and remove whitespace
     signature = signature[len(_PEM_OPENING) : -len(_PEM_CLOSING)]
-    signature = signature.translate({ord(c): None for c in string.whitespace})
+    signature = signature.translate(_WHITESPACE)
 
-    # Decode from text to ASN.1 object
+    # Decode from text to DER and check the object identifier
     der = base64.b64decode(signature, validate=True)
-    asn1, remainder = pyasn1.codec.der.decoder.decode(der)
-    if remainder:
+    body, end = _decode_tlv(der, 0, _SEQUENCE)
+    if end != len(der):
         raise ValueError("unable to decode entire signature")
-
-    # Check if the object identifier is correct
-    if asn1["field-0"] != _OBJECT_ID:
+    if not body.startswith(_OBJECT_ID_DER):
         raise ValueError("invalid object ID")
+    return body[len(_OBJECT_ID_DER) :]
 
-    # Extract data
-    key_image = Point(asn1["field-1"])
-    public_keys = [Point(public_key) for public_key in asn1["field-2"]]
-    cs = [Scalar(c) for c in asn1["field-3"]]
-    rs = [Scalar(r) for r in asn1["field-4"]]
 
-    return RingSignature(public_keys, key_image, cs, rs)
+def _decode_ring(body: bytes) -> RingSignature:
+    key_image, offset = _decode_tlv(body, 0, _OCTET_STRING)
+    public_keys, offset = _decode_sequence_of(body, offset, Point)
+    cs, offset = _decode_sequence_of(body, offset, Scalar)
+    rs, offset = _decode_sequence_of(body, offset, Scalar)
+    if offset != len(body):
+        raise ValueError("unable to decode entire signature")
+    return RingSignature(public_keys, Point(key_image), cs, rs)
 
-def import_pem(signature: str) -> WithinRingSignature:
-    signature = signature.strip()
-    if not signature.startswith(_PEM_OPENING) or not signature.endswith(_PEM_CLOSING):
-        raise ValueError("invalid encapsulation")
-    # Strip opening/closing and remove whitespace
-    signature = signature[len(_PEM_OPENING) : -len(_PEM_CLOSING)]
-    signature = signature.translate({ord(c): None for c in string.whitespace})
 
-    # Decode from text to ASN.1 object
-    der = base64.b64decode(signature, validate=True)
-    asn1, remainder = pyasn1.codec.der.decoder.decode(der)
-    if remainder:
+def _decode_within_ring(body: bytes) -> WithinRingSignature:
+    public_points, offset = _decode_sequence_of(body, 0, Point)
+    enc_points, offset = _decode_sequence_of(body, offset, Point)
+    public_keys, offset = _decode_sequence_of(body, offset, Point)
+    cs, offset = _decode_sequence_of(body, offset, Scalar)
+    rs, offset = _decode_sequence_of(body, offset, Scalar)
+    if offset != len(body):
         raise ValueError("unable to decode entire signature")
+    return WithinRingSignature(public_keys, public_points, enc_points, cs, rs)
 
-    # Check if the object identifier is correct
-    if asn1["field-0"] != _OBJECT_ID:
-        raise ValueError("invalid object ID")
 
-    # Extract data
-    public_points = [Point(public_point) for public_point in asn1["field-1"]]
-    enc_points = [Point(enc_point) for enc_point in asn1["field-2"]]
-    public_keys = [Point(public_key) for public_key in asn1["field-3"]]
-    cs = [Scalar(c) for c in asn1["field-4"]]
-    rs = [Scalar(r) for r in asn1["field-5"]]
+def import_ring_pem(signature: str) -> RingSignature:
+    """Import a ring signature from a PEM file."""
+    return _decode_ring(_decode_pem(signature))
 
-    return WithinRingSignature(public_keys, public_points, enc_points, cs, rs)
+
+def import_within_ring_pem(signature: str) -> WithinRingSignature:
+    """Import a within ring signature from a PEM file."""
+    return _decode_within_ring(_decode_pem(signature))
+
+
+def import_pem(signature: str) -> Union[RingSignature, WithinRingSignature]:
+    """Import a ring signature or within ring signature from a PEM file.
+
+    Both kinds of signatures share an object ID; ring signatures are told apart by
+    their key image, which is an octet string rather than a sequence.
+    """
+    body = _decode_pem(signature)
+    if body[:1] == bytes([_OCTET_STRING]):
+        return _decode_ring(body)
+    return _decode_within_ring(body)
@@ -12,3 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+import random
+
+from pyring.one_time import PrivateKey
+
+
+def make_ring(num_keys):
+    """Generate the private keys and the ring of public keys of some users."""
+    private_keys = [PrivateKey.generate() for _ in range(num_keys)]
+    public_keys = [private_key.public_key().point for private_key in private_keys]
+    return private_keys, public_keys
+
+
+def random_message():
+    return os.urandom(random.randint(1, 500))
@@ -14,12 +14,22 @@
 
 import hashlib
 import os
+import pickle
 
 import pytest
 
 from pyring._sodium import ffi, lib
 from pyring.sc25519 import Scalar, L
-from pyring.ge import Point, O, G, hash_to_scalar, Q
+from pyring.ge import (
+    Point,
+    O,
+    G,
+    Generator,
+    Q,
+    hash_to_scalar,
+    hasher_to_scalar,
+    new_scalar_hasher,
+)
 
 
 def test_point_constructors():
@@ -39,6 +49,7 @@ def test_point_constructors():
     uniform = ffi.new("unsigned char[]", list(digest))
     p = Point.from_hash(uniform)
     assert p.is_valid()
+    assert Point(list(p.as_bytes())) == p
 
     with pytest.raises(ValueError):
         Point(b"0" * (lib.crypto_core_ed25519_BYTES - 1))
@@ -81,6 +92,13 @@ def test_generator():
         f * G
 
 
+def test_as_buffer():
+    p = Point.from_uniform(os.urandom(32))
+    assert bytes(p.as_buffer()) == p.as_bytes()
+    digest = hashlib.sha512(p.as_bytes()).digest()
+    assert hashlib.sha512(p.as_buffer()).digest() == digest
+
+
 def test_repr():
     p = Point.from_uniform(os.urandom(32))
     assert eval(repr(p)) == p
@@ -100,3 +118,40 @@ def test_hash_to_scalar():
     assert 0 <= hash_to_scalar(b"\ff" * 64) < Q
     assert 0 <= hash_to_scalar(b"\ff" * 64, "blake2s") < Q
     assert 0 <= hash_to_scalar(b"\ff" * 64, "sha3_224") < Q
+
+    hasher = new_scalar_hasher(b"\ff" * 32)
+    hasher.update(b"\ff" * 32)
+    assert hasher_to_scalar(hasher) == hash_to_scalar(b"\ff" * 64)
+    hasher = new_scalar_hasher(b"\ff" * 64, "blake2s")
+    assert hasher_to_scalar(hasher) == hash_to_scalar(b"\ff" * 64, "blake2s")
+
+
+def test_double_scalar_mul():
+    p = Point.from_uniform(hashlib.blake2s(b"data").digest())
+    a, b = Scalar.random(), Scalar.random()
+    assert Point.double_scalar_mul(a, p, b, G) == a * p + b * G
+    assert Point.double_scalar_mul(a, G, b, p) == a * G + b * p
+    assert Point.double_scalar_mul(2, p, 3, p) == 5 * p
+    assert Point.double_scalar_mul(a, O, b, p) == b * p
+    assert Point.double_scalar_mul(a, p, b, O) == a * p
+
+    with pytest.raises(TypeError):
+        Point.double_scalar_mul(2.3, p, b, p)
+
+
+def test_mul_base():
+    x = Scalar.random()
+    assert Point.mul_base(x) == x * G
+    assert Point.mul_base(x) == x * Point(G.data)
+    assert Point.mul_base(3) == G + G + G
+
+    with pytest.raises(TypeError):
+        Point.mul_base(2.3)
+
+
+def test_pickle():
+    p = Point.from_uniform(os.urandom(32))
+    assert pickle.loads(pickle.dumps(p)) == p
+    g = pickle.loads(pickle.dumps(G))
+    assert g == G
+    assert isinstance(g, Generator)
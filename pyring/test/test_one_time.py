@@ -12,12 +12,23 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import concurrent.futures
 import dataclasses
 import os
 import random
 
-from pyring.one_time import PrivateKey, ring_sign, ring_verify
+import pytest
+
+from pyring.one_time import (
+    PrivateKey,
+    ring_sign,
+    ring_verify,
+    ring_verify_batch,
+    within_ring_sign,
+    within_ring_verify,
+)
 from pyring.sc25519 import Scalar
+from pyring.test import make_ring, random_message
 
 
 def test_keys():
@@ -27,6 +38,12 @@ def test_keys():
 
     private_key = PrivateKey.from_private_bytes(bytes(Scalar.random().data))
 
+    key_image = private_key.key_image()
+    assert key_image is private_key.key_image()
+    assert private_key.public_key() is private_key.public_key()
+    expected = private_key.scalar * private_key.public_key().point.hash_to_point()
+    assert key_image == expected
+
 
 def test_one_time():
     num_keys = 100
@@ -57,5 +74,68 @@ def test_one_time():
     assert not ring_verify(message, wrong_public_keys)
     wrong_image = dataclasses.replace(signature, key_image=2 * signature.key_image)
     assert not ring_verify(message, wrong_image)
+    truncated = dataclasses.replace(signature, c=signature.c[:-1])
+    assert not ring_verify(message, truncated)
     signature.c[0] += 1
     assert not ring_verify(message, signature)
+
+
+def test_one_time_single_key():
+    private_key = PrivateKey.generate()
+    public_keys = [private_key.public_key().point]
+    message = random_message()
+    signature = ring_sign(message, public_keys, private_key.scalar, 0)
+    assert ring_verify(message, signature)
+
+    with pytest.raises(ValueError):
+        ring_sign(message, public_keys, private_key.scalar, 1)
+
+
+def test_one_time_signer_positions():
+    private_keys, public_keys = make_ring(5)
+    message = random_message()
+    for i, private_key in enumerate(private_keys):
+        signature = ring_sign(message, public_keys, private_key.scalar, i)
+        assert ring_verify(message, signature)
+
+
+def test_ring_verify_batch():
+    private_keys, public_keys = make_ring(10)
+
+    messages = [random_message() for _ in range(5)]
+    signatures = [
+        ring_sign(message, public_keys, private_keys[i].scalar, i)
+        for i, message in enumerate(messages)
+    ]
+    assert ring_verify_batch(messages, signatures)
+    assert ring_verify_batch([], [])
+
+    assert not ring_verify_batch(messages[::-1], signatures)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=2) as executor:
+        assert ring_verify_batch(messages, signatures, executor)
+        assert not ring_verify_batch(messages[::-1], signatures, executor)
+    with pytest.raises(ValueError):
+        ring_verify_batch(messages[1:], signatures)
+
+
+def test_within_ring():
+    private_keys, public_keys = make_ring(10)
+    message = random_message()
+
+    signature = within_ring_sign(message, public_keys, private_keys[3].scalar, 3)
+    assert len(signature.public_points) == len(public_keys)
+    assert len(signature.enc_points) == len(public_keys)
+    for private_key in private_keys:
+        assert within_ring_verify(message, signature, private_key.scalar)
+        public_key = private_key.public_key().point
+        assert within_ring_verify(message, signature, private_key.scalar, public_key)
+    assert not within_ring_verify(message + b"0", signature, private_keys[0].scalar)
+    with pytest.raises(ValueError):
+        within_ring_verify(message, signature, Scalar.random())
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=2) as executor:
+        signature = within_ring_sign(
+            message, public_keys, private_keys[3].scalar, 3, executor
+        )
+    for private_key in private_keys:
+        assert within_ring_verify(message, signature, private_key.scalar)
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import pickle
+
 import pytest
 
 from pyring._sodium import ffi, lib
@@ -103,3 +105,8 @@ def test_sc_arithmetic():
         f * x
     with pytest.raises(TypeError):
         x * f
+
+
+def test_sc_pickle():
+    x = Scalar.random()
+    assert pickle.loads(pickle.dumps(x)) == x
@@ -0,0 +1,103 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from pyring.ge import Point
+from pyring.one_time import (
+    RingSignature,
+    WithinRingSignature,
+    ring_sign,
+    within_ring_sign,
+)
+from pyring.sc25519 import Scalar
+from pyring.serialize import (
+    export_ring_pem,
+    export_within_ring_pem,
+    import_pem,
+    import_ring_pem,
+    import_within_ring_pem,
+)
+from pyring.test import make_ring, random_message
+
+RING_PEM = """-----BEGIN RING SIGNATURE-----
+MIGpBhlpO15hgS+BRIFsSW6BFYFpS2SBPIFNgUgJBCDUtPV4SGjDAgQDJGcX7Baf
+954mYI6hJqGrae530bFnEjAiBCDJo/hqrkZfDlZROGRRDzmXVh+iyeheoh3CKSMJ
+881gIjAiBCAFAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADAiBCAHAAAA
+AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA==
+-----END RING SIGNATURE-----"""
+
+WITHIN_RING_PEM = """-----BEGIN RING SIGNATURE-----
+MIHPBhlpO15hgS+BRIFsSW6BFYFpS2SBPIFNgUgJMCIEINS09XhIaMMCBAMkZxfs
+Fp/3niZgjqEmoatp7nfRsWcSMCIEIC8RMsphqzjf8A8v6jIo8kxscdWAhbgOR+GV
+Fcsn6NBHMCIEIMmj+GquRl8OVlE4ZFEPOZdWH6LJ6F6iHcIpIwnzzWAiMCIEIAUA
+AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMCIEIAcAAAAAAAAAAAAAAAAA
+AAAAAAAAAAAAAAAAAAAAAAAA
+-----END RING SIGNATURE-----"""
+
+
+def test_export_ring_pem():
+    signature = RingSignature(
+        [Point.mul_base(2)], Point.mul_base(3), [Scalar(5)], [Scalar(7)]
+    )
+    assert export_ring_pem(signature) == RING_PEM
+    assert import_ring_pem(RING_PEM) == signature
+    assert import_pem(RING_PEM) == signature
+
+
+def test_export_within_ring_pem():
+    signature = WithinRingSignature(
+        [Point.mul_base(2)],
+        [Point.mul_base(3)],
+        [Point.mul_base(4)],
+        [Scalar(5)],
+        [Scalar(7)],
+    )
+    assert export_within_ring_pem(signature) == WITHIN_RING_PEM
+    assert import_within_ring_pem(WITHIN_RING_PEM) == signature
+    assert import_pem(WITHIN_RING_PEM) == signature
+
+
+def test_ring_round_trip():
+    private_keys, public_keys = make_ring(10)
+    message = random_message()
+    signature = ring_sign(message, public_keys, private_keys[0].scalar, 0)
+
+    pem = export_ring_pem(signature)
+    assert import_ring_pem(pem) == signature
+
+
+def test_within_ring_round_trip():
+    private_keys, public_keys = make_ring(10)
+    message = random_message()
+    signature = within_ring_sign(message, public_keys, private_keys[0].scalar, 0)
+
+    pem = export_within_ring_pem(signature)
+    assert pem == export_within_ring_pem(signature)
+    assert import_within_ring_pem(pem) == signature
+    pem = "\n  " + pem.replace("\n", "\r\n") + "\n"
+    assert import_within_ring_pem(pem) == signature
+
+
+def test_import_pem_errors():
+    with pytest.raises(ValueError):
+        import_ring_pem(WITHIN_RING_PEM)
+    with pytest.raises(ValueError):
+        import_within_ring_pem(RING_PEM)
+    with pytest.raises(ValueError):
+        import_pem(WITHIN_RING_PEM[1:])
+    with pytest.raises(ValueError):
+        import_pem(WITHIN_RING_PEM.replace("MIHPBhlpO15h", "MIHPBhlpO15i"))
+    with pytest.raises(ValueError):
+        import_pem(WITHIN_RING_PEM.replace("MIHPBhlp", "MIHQBhlp"))
@@ -25,8 +25,8 @@ def as_array(data: ByteLike) -> ffi.CData:
     """Convert a bytes-like object into an FFI-array.
 
     Args:
-        data: An object that can convert to a list of integers.
-            If an FFI array is passed, it will be returned as is.
+        data: A bytes-like object, or an object that can be converted to bytes (e.g. a
+            list of integers). If an FFI array is passed, it will be returned as is.
 
     Returns:
         An FFI `CData` array with the given value.
@@ -34,5 +34,12 @@ def as_array(data: ByteLike) -> ffi.CData:
     """
     if isinstance(data, ffi.CData):
         return data
-    array = ffi.new("unsigned char[]", list(data))
+    try:
+        view = memoryview(data)
+    except TypeError:
+        # Objects without a buffer (e.g. lists of integers) are converted first
+        view = memoryview(bytes(data))
+    # Copy the buffer directly instead of converting it to a list of integers
+    array = ffi.new("unsigned char[]", view.nbytes)
+    ffi.memmove(array, view, view.nbytes)
     return array
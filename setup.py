@@ -73,10 +73,17 @@ class build_clib(_build_clib):
         src_dir = pathlib.Path("libsodium").resolve()
         root_dir = os.getcwd()
 
+        configure = [f"{src_dir}/configure", f"--prefix={build_temp}",
+                     "--disable-shared", "--with-pic"]
+        # Optionally let libsodium optimize for the CPU it is built on (e.g. to make
+        # use of AVX2, AVX-512 or ARMv8 extensions); the resulting library is not
+        # portable
+        if os.environ.get("PYRING_NATIVE_OPT", "").lower() in ("1", "true", "yes"):
+            configure.append("--enable-opt")
+
         # Now build libsodium statically (to avoid linker issues)
         os.chdir(build_temp)
-        self.spawn([f"{src_dir}/configure", f"--prefix={build_temp}",
-                    "--disable-shared", "--with-pic"])
+        self.spawn(configure)
         self.spawn(["make"])
         self.spawn(["make", "install"])
 